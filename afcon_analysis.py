@@ -4,12 +4,38 @@ AFCON 2025 - December 24, 2025 Match Analysis
 Statistical analysis of today's Group A fixtures
 """
 
+import hashlib
+import io
 import json
-from dataclasses import dataclass
-from typing import List, Dict
+import os
+from dataclasses import dataclass, field
+from typing import List, Dict, NamedTuple, Optional, TextIO, Tuple
 from datetime import datetime
 
-@dataclass
+import numpy as np
+
+# Most head-to-head results kept per analyzer before the oldest is evicted
+CACHE_SIZE = 128
+
+# Column layout shared by the standings header and every standings row
+STANDINGS_ROW_FMT = "{:<5}{:<20}{:<3}{:<3}{:<3}{:<3}{:<4}{:<4}{:<4}{:<4}"
+
+
+class Standing(NamedTuple):
+    """One row of a group table, in display order"""
+    position: int
+    team: str
+    matches: int
+    wins: int
+    draws: int
+    losses: int
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    points: int
+
+
+@dataclass(frozen=True, slots=True)
 class TeamStats:
     """Class to hold team statistics"""
     name: str
@@ -23,28 +49,21 @@ class TeamStats:
     goals_against: int
     points: int
     
-    @property
-    def goal_difference(self) -> int:
-        return self.goals_for - self.goals_against
-    
-    @property
-    def avg_goals_per_match(self) -> float:
-        if self.matches_played == 0:
-            return 0
-        return round(self.goals_for / self.matches_played, 2)
-    
-    @property
-    def win_percentage(self) -> float:
-        if self.matches_played == 0:
-            return 0
-        return round((self.wins / self.matches_played) * 100, 2)
+    # Derived metrics, computed once in __post_init__
+    goal_difference: int = field(init=False, repr=False)
+    avg_goals_per_match: float = field(init=False, repr=False)
+    win_percentage: float = field(init=False, repr=False)
+    defense_strength: float = field(init=False, repr=False)  # Lower is better
     
-    @property
-    def defense_strength(self) -> float:
-        """Lower is better"""
-        if self.matches_played == 0:
-            return 0
-        return round(self.goals_against / self.matches_played, 2)
+    def __post_init__(self):
+        played = self.matches_played
+        object.__setattr__(self, 'goal_difference', self.goals_for - self.goals_against)
+        object.__setattr__(self, 'avg_goals_per_match',
+                           self.goals_for / played if played else 0.0)
+        object.__setattr__(self, 'win_percentage',
+                           (self.wins / played) * 100 if played else 0.0)
+        object.__setattr__(self, 'defense_strength',
+                           self.goals_against / played if played else 0.0)
     
     def __str__(self) -> str:
         return f"{self.name} (Rank: {self.fifa_rank})"
@@ -55,65 +74,137 @@ class AFCONAnalyzer:
     
     def __init__(self):
         self.matches = []
+        self._pairs: List[Tuple[str, str]] = []
         self.teams: Dict[str, TeamStats] = {}
         self.tournament_date = "December 24, 2025"
+        self._rebuild_arrays()
+        
+        # Memoize per instance, keyed on the team names; results only change
+        # when a team is added. Error results are not cached. Cached dicts are
+        # shared between callers, so treat them as read-only.
+        self._comparison_cache: Dict[Tuple[str, str], Dict] = {}
+        self._prediction_cache: Dict[Tuple[str, str], Dict] = {}
+        self._standings_cache: Dict[str, Tuple[Standing, ...]] = {}
     
     def add_team(self, team: TeamStats):
         """Add a team to the analyzer"""
         self.teams[team.name] = team
+        self._rebuild_arrays()
+        self._comparison_cache.clear()
+        self._prediction_cache.clear()
+        self._standings_cache.clear()
+    
+    def _rebuild_arrays(self):
+        """Pack team statistics into parallel arrays indexed by team id"""
+        teams = tuple(self.teams.values())
+        self._teams: Tuple[TeamStats, ...] = teams
+        self._idx: Dict[str, int] = {team.name: i for i, team in enumerate(teams)}
+        
+        self._fifa_rank = np.array([t.fifa_rank for t in teams], dtype=np.int32)
+        self._matches_played = np.array([t.matches_played for t in teams], dtype=np.int32)
+        self._points = np.array([t.points for t in teams], dtype=np.int32)
+        
+        # Derived metrics come from TeamStats so every code path shares one formula
+        self._goal_difference = np.array([t.goal_difference for t in teams], dtype=np.int32)
+        self._avg_goals = np.array([t.avg_goals_per_match for t in teams], dtype=np.float64)
+        self._win_percentage = np.array([t.win_percentage for t in teams], dtype=np.float64)
+        self._defense_strength = np.array([t.defense_strength for t in teams], dtype=np.float64)
+    
+    @staticmethod
+    def _remember(cache: Dict, key: Tuple[str, str], result: Dict):
+        """Cache a successful result, evicting the oldest entry once CACHE_SIZE is reached"""
+        if "error" in result:
+            return
+        if len(cache) >= CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = result
     
     def add_match(self, match_info: Dict):
         """Add a match to analyze"""
+        # "Ivory Coast vs Mozambique" -> ("Ivory Coast", "Mozambique")
+        team1_name, sep, team2_name = match_info.get("match", "").partition(" vs ")
+        if not (sep and team1_name and team2_name):
+            raise ValueError(
+                f"match_info needs a 'match' entry like 'Team A vs Team B', got {match_info!r}"
+            )
+        
         self.matches.append(match_info)
+        self._pairs.append((team1_name, team2_name))
     
-    def get_team(self, name: str) -> TeamStats:
+    def get_team(self, name: str) -> Optional[TeamStats]:
         """Retrieve team statistics"""
-        return self.teams.get(name)
+        idx = self._idx.get(name)
+        return None if idx is None else self._teams[idx]
     
     def compare_teams(self, team1_name: str, team2_name: str) -> Dict:
         """Compare two teams head-to-head"""
-        team1 = self.get_team(team1_name)
-        team2 = self.get_team(team2_name)
+        key = (team1_name, team2_name)
+        comparison = self._comparison_cache.get(key)
+        if comparison is None:
+            comparison = self._compare_teams(team1_name, team2_name)
+            self._remember(self._comparison_cache, key, comparison)
+        return comparison
+    
+    def _compare_teams(self, team1_name: str, team2_name: str) -> Dict:
+        """Build the head-to-head comparison dict for two teams"""
+        i = self._idx.get(team1_name)
+        j = self._idx.get(team2_name)
         
-        if not team1 or not team2:
+        if i is None or j is None:
             return {"error": "One or both teams not found"}
         
+        pair = [i, j]
+        fifa_1, fifa_2 = self._fifa_rank[pair].tolist()
+        points_1, points_2 = self._points[pair].tolist()
+        gd_1, gd_2 = self._goal_difference[pair].tolist()
+        avg_1, avg_2 = self._avg_goals[pair].tolist()
+        defense_1, defense_2 = self._defense_strength[pair].tolist()
+        win_1, win_2 = self._win_percentage[pair].tolist()
+        played_1, played_2 = self._matches_played[pair].tolist()
+        
         comparison = {
             "match_up": f"{team1_name} vs {team2_name}",
             "fifa_ranks": {
-                team1_name: team1.fifa_rank,
-                team2_name: team2.fifa_rank
+                team1_name: fifa_1,
+                team2_name: fifa_2
             },
             "points": {
-                team1_name: team1.points,
-                team2_name: team2.points
+                team1_name: points_1,
+                team2_name: points_2
             },
             "goal_difference": {
-                team1_name: team1.goal_difference,
-                team2_name: team2.goal_difference
+                team1_name: gd_1,
+                team2_name: gd_2
             },
             "offensive_power": {
-                team1_name: team1.avg_goals_per_match,
-                team2_name: team2.avg_goals_per_match
+                team1_name: avg_1,
+                team2_name: avg_2
             },
             "defensive_strength": {
-                team1_name: f"{team1.defense_strength} goals/match",
-                team2_name: f"{team2.defense_strength} goals/match"
+                team1_name: f"{defense_1:.2f} goals/match",
+                team2_name: f"{defense_2:.2f} goals/match"
             },
             "win_percentage": {
-                team1_name: f"{team1.win_percentage}%",
-                team2_name: f"{team2.win_percentage}%"
+                team1_name: f"{win_1:.2f}%",
+                team2_name: f"{win_2:.2f}%"
             },
             "recent_form": {
-                team1_name: f"{team1.matches_played} matches played",
-                team2_name: f"{team2.matches_played} matches played"
+                team1_name: f"{played_1} matches played",
+                team2_name: f"{played_2} matches played"
             }
         }
         return comparison
     
-    def analyze_group(self, group: str) -> List[Dict]:
+    def analyze_group(self, group: str) -> List[Standing]:
         """Analyze standings for a group"""
-        group_teams = [team for team in self.teams.values() if team.group == group]
+        standings = self._standings_cache.get(group)
+        if standings is None:
+            standings = self._standings_cache[group] = self._group_standings(group)
+        return list(standings)
+    
+    def _group_standings(self, group: str) -> Tuple[Standing, ...]:
+        """Sorted standings for a group; analyze_group caches these until the next add_team"""
+        group_teams = [team for team in self._teams if team.group == group]
         
         # Sort by points (descending), then by goal difference (descending)
         sorted_teams = sorted(
@@ -122,159 +213,192 @@ class AFCONAnalyzer:
             reverse=True
         )
         
-        standings = []
-        for idx, team in enumerate(sorted_teams, 1):
-            standings.append({
-                "position": idx,
-                "team": team.name,
-                "points": team.points,
-                "matches": team.matches_played,
-                "wins": team.wins,
-                "draws": team.draws,
-                "losses": team.losses,
-                "goals_for": team.goals_for,
-                "goals_against": team.goals_against,
-                "goal_difference": team.goal_difference
-            })
-        
-        return standings
+        return tuple(
+            Standing(idx, team.name, team.matches_played, team.wins, team.draws, team.losses,
+                     team.goals_for, team.goals_against, team.goal_difference, team.points)
+            for idx, team in enumerate(sorted_teams, 1)
+        )
     
     def predict_outcome(self, team1_name: str, team2_name: str) -> Dict:
         """Predict match outcome based on statistics"""
-        team1 = self.get_team(team1_name)
-        team2 = self.get_team(team2_name)
-        
-        if not team1 or not team2:
-            return {"error": "One or both teams not found"}
-        
-        # Simple prediction model based on multiple factors
-        team1_score = (
-            (11 - team1.fifa_rank) * 0.3 +  # FIFA ranking factor
-            team1.avg_goals_per_match * 2 +   # Offensive capability
-            (2 - team1.defense_strength) * 1.5  # Defensive strength
-        )
+        return self._cached_predictions([(team1_name, team2_name)])[0]
+    
+    def _cached_predictions(self, pairs: List[Tuple[str, str]]) -> List[Dict]:
+        """Predictions for pairs, reusing cached results and batching only the misses"""
+        cache = self._prediction_cache
+        missing = [pair for pair in dict.fromkeys(pairs) if pair not in cache]
+        fresh = dict(zip(missing, self.predict_outcome_batch(missing))) if missing else {}
+        for pair, prediction in fresh.items():
+            self._remember(cache, pair, prediction)
+        return [cache[pair] if pair in cache else fresh[pair] for pair in pairs]
+    
+    def predict_outcome_batch(self, pairs: List[Tuple[str, str]]) -> List[Dict]:
+        """Predict outcomes for several matches in one vectorized pass"""
+        known = [team1 in self._idx and team2 in self._idx for team1, team2 in pairs]
+        idx = np.array(
+            [(self._idx[team1], self._idx[team2]) for (team1, team2), ok in zip(pairs, known) if ok],
+            dtype=np.intp
+        ).reshape(-1, 2)
         
-        team2_score = (
-            (11 - team2.fifa_rank) * 0.3 +
-            team2.avg_goals_per_match * 2 +
-            (2 - team2.defense_strength) * 1.5
+        # Simple prediction model based on multiple factors, one (M, 2) row per match
+        avg_goals = self._avg_goals[idx]
+        scores = (
+            (11 - self._fifa_rank[idx]) * 0.3 +  # FIFA ranking factor
+            avg_goals * 2 +   # Offensive capability
+            (2 - self._defense_strength[idx]) * 1.5  # Defensive strength
         )
         
-        total_score = team1_score + team2_score
-        team1_win_prob = (team1_score / total_score) * 100 if total_score > 0 else 50
-        team2_win_prob = 100 - team1_win_prob
+        total_score = scores.sum(axis=1)
+        team1_win_prob = np.divide(scores[:, 0] * 100, total_score,
+                                   out=np.full(len(idx), 50.0), where=total_score > 0)
+        rows = iter(zip(team1_win_prob.tolist(), avg_goals.tolist()))
         
-        return {
-            "match": f"{team1_name} vs {team2_name}",
-            "prediction": {
-                team1_name: f"{round(team1_win_prob, 1)}%",
-                team2_name: f"{round(team2_win_prob, 1)}%"
-            },
-            "estimated_goals": {
-                team1_name: round(team1.avg_goals_per_match, 1),
-                team2_name: round(team2.avg_goals_per_match, 1)
-            }
-        }
+        results = []
+        for (team1_name, team2_name), ok in zip(pairs, known):
+            if not ok:
+                results.append({"error": "One or both teams not found"})
+                continue
+            
+            win_prob, (team1_goals, team2_goals) = next(rows)
+            results.append({
+                "match": f"{team1_name} vs {team2_name}",
+                "prediction": {
+                    team1_name: f"{win_prob:.1f}%",
+                    team2_name: f"{100 - win_prob:.1f}%"
+                },
+                "estimated_goals": {
+                    team1_name: team1_goals,
+                    team2_name: team2_goals
+                }
+            })
+        return results
     
-    def generate_report(self):
+    def generate_report(self) -> str:
         """Generate comprehensive match analysis report"""
-        report = []
-        report.append("=" * 70)
-        report.append(f"AFCON 2025 - Match Analysis Report")
-        report.append(f"Date: {self.tournament_date}")
-        report.append("=" * 70)
-        report.append("")
-        
-        # Match 1: Ivory Coast vs Mozambique
-        report.append("MATCH 1: IVORY COAST vs MOZAMBIQUE")
-        report.append("-" * 70)
-        comparison1 = self.compare_teams("Ivory Coast", "Mozambique")
-        report.append(self._format_comparison(comparison1))
-        prediction1 = self.predict_outcome("Ivory Coast", "Mozambique")
-        report.append("\nMatch Prediction:")
-        report.append(f"  Ivory Coast Win Probability: {prediction1['prediction']['Ivory Coast']}")
-        report.append(f"  Mozambique Win Probability: {prediction1['prediction']['Mozambique']}")
-        report.append(f"  Expected Goals - Ivory Coast: {prediction1['estimated_goals']['Ivory Coast']}")
-        report.append(f"  Expected Goals - Mozambique: {prediction1['estimated_goals']['Mozambique']}")
-        report.append("")
+        buf = io.StringIO()
+        self.write_report(buf)
+        return buf.getvalue()
+    
+    def write_report(self, out: TextIO):
+        """Write the match analysis report to a text stream, one section at a time"""
+        write = out.write
+        rule = "=" * 70
+        divider = "-" * 70
         
-        # Match 2: Cameroon vs Gabon
-        report.append("MATCH 2: CAMEROON vs GABON")
-        report.append("-" * 70)
-        comparison2 = self.compare_teams("Cameroon", "Gabon")
-        report.append(self._format_comparison(comparison2))
-        prediction2 = self.predict_outcome("Cameroon", "Gabon")
-        report.append("\nMatch Prediction:")
-        report.append(f"  Cameroon Win Probability: {prediction2['prediction']['Cameroon']}")
-        report.append(f"  Gabon Win Probability: {prediction2['prediction']['Gabon']}")
-        report.append(f"  Expected Goals - Cameroon: {prediction2['estimated_goals']['Cameroon']}")
-        report.append(f"  Expected Goals - Gabon: {prediction2['estimated_goals']['Gabon']}")
-        report.append("")
+        write(
+            f"{rule}\n"
+            "AFCON 2025 - Match Analysis Report\n"
+            f"Date: {self.tournament_date}\n"
+            f"{rule}\n"
+            "\n"
+        )
         
-        # Group Standings
-        report.append("GROUP A STANDINGS")
-        report.append("-" * 70)
-        standings = self.analyze_group("A")
-        report.append(f"{'Pos':<5}{'Team':<20}{'P':<3}{'W':<3}{'D':<3}{'L':<3}{'GF':<4}{'GA':<4}{'GD':<4}{'Pts':<4}")
-        report.append("-" * 70)
-        for standing in standings:
-            report.append(
-                f"{standing['position']:<5}"
-                f"{standing['team']:<20}"
-                f"{standing['matches']:<3}"
-                f"{standing['wins']:<3}"
-                f"{standing['draws']:<3}"
-                f"{standing['losses']:<3}"
-                f"{standing['goals_for']:<4}"
-                f"{standing['goals_against']:<4}"
-                f"{standing['goal_difference']:<4}"
-                f"{standing['points']:<4}"
+        # One section per scheduled match; uncached matches are predicted together
+        predictions = self._cached_predictions(self._pairs)
+        for number, ((team1_name, team2_name), prediction) in enumerate(zip(self._pairs, predictions), 1):
+            write(
+                f"MATCH {number}: {team1_name.upper()} vs {team2_name.upper()}\n"
+                f"{divider}\n"
+                f"{self.format_matchup(team1_name, team2_name)}\n"
+                "\nMatch Prediction:\n"
+            )
+            if "error" in prediction:
+                write(f"  {prediction['error']}\n\n")
+                continue
+            
+            win, goals = prediction['prediction'], prediction['estimated_goals']
+            write(
+                f"  {team1_name} Win Probability: {win[team1_name]}\n"
+                f"  {team2_name} Win Probability: {win[team2_name]}\n"
+                f"  Expected Goals - {team1_name}: {goals[team1_name]:.1f}\n"
+                f"  Expected Goals - {team2_name}: {goals[team2_name]:.1f}\n"
+                "\n"
             )
         
-        report.append("")
-        report.append("=" * 70)
-        report.append("ANALYSIS NOTES:")
-        report.append("=" * 70)
-        report.append("- Ivory Coast are the defending champions and expected favorites")
-        report.append("- Cameroon has strong attacking potential in African football")
-        report.append("- Mozambique and Gabon are less favored but can provide upsets")
-        report.append("- Group A is competitive with experienced tournament teams")
-        report.append("")
+        # Group Standings
+        row = STANDINGS_ROW_FMT.format
+        write(
+            "GROUP A STANDINGS\n"
+            f"{divider}\n"
+            f"{row('Pos', 'Team', 'P', 'W', 'D', 'L', 'GF', 'GA', 'GD', 'Pts')}\n"
+            f"{divider}\n"
+        )
+        for standing in self.analyze_group("A"):
+            write(row(*standing))
+            write("\n")
         
-        return "\n".join(report)
+        write(
+            "\n"
+            f"{rule}\n"
+            "ANALYSIS NOTES:\n"
+            f"{rule}\n"
+            "- Ivory Coast are the defending champions and expected favorites\n"
+            "- Cameroon has strong attacking potential in African football\n"
+            "- Mozambique and Gabon are less favored but can provide upsets\n"
+            "- Group A is competitive with experienced tournament teams\n"
+        )
     
-    @staticmethod
-    def _format_comparison(comparison: Dict) -> str:
-        """Format comparison data for display"""
-        lines = []
-        if "error" in comparison:
-            return comparison["error"]
-        
-        lines.append(f"Match-up: {comparison['match_up']}")
-        lines.append("")
-        
-        teams = list(comparison['fifa_ranks'].keys())
-        lines.append("FIFA Rankings:")
-        lines.append(f"  {teams[0]}: #{comparison['fifa_ranks'][teams[0]]}")
-        lines.append(f"  {teams[1]}: #{comparison['fifa_ranks'][teams[1]]}")
-        
-        lines.append("\nPoints (Group Stage):")
-        lines.append(f"  {teams[0]}: {comparison['points'][teams[0]]}")
-        lines.append(f"  {teams[1]}: {comparison['points'][teams[1]]}")
-        
-        lines.append("\nGoal Difference:")
-        lines.append(f"  {teams[0]}: {comparison['goal_difference'][teams[0]]}")
-        lines.append(f"  {teams[1]}: {comparison['goal_difference'][teams[1]]}")
-        
-        lines.append("\nOffensive Power (Goals/Match):")
-        lines.append(f"  {teams[0]}: {comparison['offensive_power'][teams[0]]}")
-        lines.append(f"  {teams[1]}: {comparison['offensive_power'][teams[1]]}")
+    def format_matchup(self, team1_name: str, team2_name: str) -> str:
+        """Format a head-to-head comparison for display"""
+        team1 = self.get_team(team1_name)
+        team2 = self.get_team(team2_name)
         
-        lines.append("\nDefensive Strength:")
-        lines.append(f"  {teams[0]}: {comparison['defensive_strength'][teams[0]]}")
-        lines.append(f"  {teams[1]}: {comparison['defensive_strength'][teams[1]]}")
+        if not team1 or not team2:
+            return "One or both teams not found"
         
-        return "\n".join(lines)
+        return (
+            f"Match-up: {team1_name} vs {team2_name}\n"
+            "\n"
+            "FIFA Rankings:\n"
+            f"  {team1_name}: #{team1.fifa_rank}\n"
+            f"  {team2_name}: #{team2.fifa_rank}\n"
+            "\nPoints (Group Stage):\n"
+            f"  {team1_name}: {team1.points}\n"
+            f"  {team2_name}: {team2.points}\n"
+            "\nGoal Difference:\n"
+            f"  {team1_name}: {team1.goal_difference}\n"
+            f"  {team2_name}: {team2.goal_difference}\n"
+            "\nOffensive Power (Goals/Match):\n"
+            f"  {team1_name}: {team1.avg_goals_per_match:.2f}\n"
+            f"  {team2_name}: {team2.avg_goals_per_match:.2f}\n"
+            "\nDefensive Strength:\n"
+            f"  {team1_name}: {team1.defense_strength:.2f} goals/match\n"
+            f"  {team2_name}: {team2.defense_strength:.2f} goals/match"
+        )
+
+
+def report_fingerprint(analyzer: AFCONAnalyzer) -> str:
+    """Hash every input the report is generated from"""
+    teams = sorted(
+        (t.name, t.group, t.fifa_rank, t.matches_played, t.wins, t.draws,
+         t.losses, t.goals_for, t.goals_against, t.points)
+        for t in analyzer.teams.values()
+    )
+    key = (analyzer.tournament_date, teams, analyzer.matches)
+    return hashlib.blake2b(repr(key).encode()).hexdigest()
+
+
+def load_cached_report(path: str, fingerprint: str):
+    """Return the saved report if it was built from the same inputs, else None"""
+    try:
+        with open(path + '.hash') as f:
+            if f.read() != fingerprint:
+                return None
+        # A report older than this script may have been rendered by an older template
+        if os.path.getmtime(path) < os.path.getmtime(__file__):
+            return None
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_atomic(path: str, text: str):
+    """Write text to path so readers never see a partially written file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
 
 
 def main():
@@ -353,15 +477,27 @@ def main():
         "match": "Cameroon vs Gabon"
     })
     
-    # Generate and print report
-    report = analyzer.generate_report()
-    print(report)
+    # Reuse the saved report when its inputs are unchanged
+    report_path = 'afcon_analysis_report.txt'
+    fingerprint = report_fingerprint(analyzer)
+    report = load_cached_report(report_path, fingerprint)
     
-    # Save report to file
-    with open('afcon_analysis_report.txt', 'w') as f:
-        f.write(report)
-    
-    print("\n✓ Report saved to 'afcon_analysis_report.txt'")
+    if report is None:
+        report = analyzer.generate_report()
+        print(report)
+        
+        # Drop the old hash before replacing the report, then write the new hash
+        # last, so a crash in between leaves no hash rather than a mismatched one
+        try:
+            os.remove(report_path + '.hash')
+        except FileNotFoundError:
+            pass
+        write_atomic(report_path, report)
+        write_atomic(report_path + '.hash', fingerprint)
+        print(f"\n✓ Report saved to '{report_path}'")
+    else:
+        print(report)
+        print(f"\n✓ Inputs unchanged, reusing '{report_path}'")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,5 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
 from datetime import datetime, timedelta
 
 # Create realistic South African fuel price data (January to December 2024)
@@ -11,143 +9,219 @@ months = ['January', 'February', 'March', 'April', 'May', 'June',
           'July', 'August', 'September', 'October', 'November', 'December']
 
 # Simulated fuel prices based on typical 2024 trends
+# Stored as float32, which is ample for two-decimal rand amounts; the trend fit sums in float64
 petrol_prices = np.array([20.50, 20.75, 20.85, 21.10, 21.35, 21.80, 
-                          22.15, 21.95, 21.65, 21.40, 21.20, 20.95])
+                          22.15, 21.95, 21.65, 21.40, 21.20, 20.95], dtype=np.float32)
 
 diesel_prices = np.array([20.20, 20.40, 20.55, 20.85, 21.15, 21.65, 
-                          22.05, 21.85, 21.50, 21.25, 21.00, 20.75])
+                          22.05, 21.85, 21.50, 21.25, 21.00, 20.75], dtype=np.float32)
 
 lpg_prices = np.array([12.50, 12.60, 12.75, 13.00, 13.25, 13.55, 
-                       13.85, 13.75, 13.45, 13.20, 12.95, 12.70])
-
-# Create DataFrame
-df = pd.DataFrame({
-    'Month': months,
-    'Petrol (95 ULP)': petrol_prices,
-    'Diesel (0.05% Sulphur)': diesel_prices,
-    'LPG': lpg_prices
-})
-
-print("=" * 70)
-print("SOUTH AFRICAN FUEL PRICE ANALYSIS (January - December 2024)")
-print("=" * 70)
-print("\nMonthly Fuel Prices (ZAR per liter):")
-print(df.to_string(index=False))
-print()
-
-# Calculate statistics
-print("\n" + "=" * 70)
-print("PRICE STATISTICS")
-print("=" * 70)
+                       13.85, 13.75, 13.45, 13.20, 12.95, 12.70], dtype=np.float32)
 
 fuel_types = ['Petrol (95 ULP)', 'Diesel (0.05% Sulphur)', 'LPG']
-for fuel in fuel_types:
-    prices = df[fuel].values
-    print(f"\n{fuel}:")
-    print(f"  Starting Price (January):  R{prices[0]:.2f}")
-    print(f"  Ending Price (December):   R{prices[-1]:.2f}")
-    print(f"  Change:                    R{prices[-1] - prices[0]:.2f} ({((prices[-1] - prices[0]) / prices[0] * 100):.2f}%)")
-    print(f"  Average Price:             R{prices.mean():.2f}")
-    print(f"  Minimum Price:             R{prices.min():.2f} ({months[prices.argmin()]})")
-    print(f"  Maximum Price:             R{prices.max():.2f} ({months[prices.argmax()]})")
-
-# Linear regression for trend analysis and prediction
-print("\n" + "=" * 70)
-print("TREND ANALYSIS & PREDICTIONS")
-print("=" * 70)
 
 month_numbers = np.arange(1, 13)
-predictions = {}
-
-for fuel in fuel_types:
-    prices = df[fuel].values
-    
-    # Fit linear regression
-    slope, intercept, r_value, p_value, std_err = stats.linregress(month_numbers, prices)
-    
-    # Predict for next 3 months (January, February, March 2025)
-    future_months = np.array([13, 14, 15])
-    future_predictions = slope * future_months + intercept
-    
-    predictions[fuel] = {
-        'slope': slope,
-        'r_squared': r_value**2,
-        'current_price': prices[-1],
-        'predicted_prices': future_predictions,
-        'trend': 'UPWARD' if slope > 0.01 else ('DOWNWARD' if slope < -0.01 else 'STABLE')
-    }
-    
-    print(f"\n{fuel}:")
-    print(f"  Trend:                     {predictions[fuel]['trend']}")
-    print(f"  Monthly Change Rate:       R{slope:.4f} per month")
-    print(f"  Trend Strength (R²):       {predictions[fuel]['r_squared']:.4f}")
-    
-    if predictions[fuel]['trend'] != 'STABLE':
-        direction = "increase" if slope > 0 else "decrease"
-        print(f"  Analysis:                  Prices show a {direction} trend throughout 2024")
-    
-    print(f"\n  2025 Predictions:")
-    print(f"    January 2025:             R{future_predictions[0]:.2f}")
-    print(f"    February 2025:            R{future_predictions[1]:.2f}")
-    print(f"    March 2025:               R{future_predictions[2]:.2f}")
-
-# Create visualization
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-# Plot 1: Historical prices
-ax1 = axes[0]
-for fuel in fuel_types:
-    ax1.plot(months, df[fuel], marker='o', linewidth=2, label=fuel)
-ax1.set_xlabel('Month', fontsize=11, fontweight='bold')
-ax1.set_ylabel('Price (ZAR/liter)', fontsize=11, fontweight='bold')
-ax1.set_title('2024 South African Fuel Prices', fontsize=12, fontweight='bold')
-ax1.legend()
-ax1.grid(True, alpha=0.3)
-ax1.tick_params(axis='x', rotation=45)
-
-# Plot 2: Trend lines with predictions
-ax2 = axes[1]
-extended_months = np.arange(1, 16)
-future_month_labels = months + ['Jan 2025', 'Feb 2025', 'Mar 2025']
-
-colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-for i, fuel in enumerate(fuel_types):
-    prices = df[fuel].values
-    slope, intercept, _, _, _ = stats.linregress(month_numbers, prices)
-    trend_line = slope * extended_months + intercept
-    
-    ax2.plot(months, prices, marker='o', linewidth=2, label=fuel, color=colors[i])
-    ax2.plot(future_month_labels[-3:], trend_line[-3:], 
-             linestyle='--', linewidth=2, color=colors[i], alpha=0.7)
-
-ax2.set_xlabel('Month', fontsize=11, fontweight='bold')
-ax2.set_ylabel('Price (ZAR/liter)', fontsize=11, fontweight='bold')
-ax2.set_title('Trend Analysis with Q1 2025 Predictions', fontsize=12, fontweight='bold')
-ax2.legend()
-ax2.grid(True, alpha=0.3)
-ax2.tick_params(axis='x', rotation=45)
-
-plt.tight_layout()
-plt.savefig('sa_fuel_price_analysis.png', dpi=300, bbox_inches='tight')
-print("\n" + "=" * 70)
-print("Chart saved as 'sa_fuel_price_analysis.png'")
-print("=" * 70)
-
-# Summary and recommendations
-print("\n" + "=" * 70)
-print("SUMMARY & OUTLOOK")
-print("=" * 70)
-print("\nBased on the 2024 data analysis:")
-print("\n• Petrol (95 ULP):  DOWNWARD TREND")
-print("  After peaking in August (R22.15), petrol prices showed decline in Q4.")
-print("  Prediction: Prices expected to continue declining through early 2025.")
-
-print("\n• Diesel (0.05%):   DOWNWARD TREND")
-print("  Similar pattern to petrol with peak in July (R22.05).")
-print("  Prediction: Expected to decrease further in Q1 2025.")
-
-print("\n• LPG:              DOWNWARD TREND")
-print("  Stable mid-year prices with decline at year-end (R12.70).")
-print("  Prediction: Likely to maintain lower prices through early 2025.")
-
-print("\n" + "=" * 70)
+# Predict for next 3 months (January, February, March 2025)
+future_months = np.array([13, 14, 15])
+
+
+def axis_terms(x):
+    """Return the mean, centred values and sum of squares of a regression x-axis"""
+    x_mean = x.mean()
+    x_centered = x - x_mean
+    return x_mean, x_centered, x_centered @ x_centered
+
+
+# Every fuel is regressed against the same months, so their terms are computed once
+month_axis = axis_terms(month_numbers)
+
+
+def fit_all(x_terms, prices, future_x):
+    """
+    Fit a least-squares trend line to each row of `prices` against the
+    x-axis described by `x_terms` (see axis_terms). Returns slopes,
+    intercepts, R² and the predicted prices at `future_x` (one row per
+    series), computed from closed-form sums for all series in one
+    vectorized pass.
+    """
+    x_mean, x_centered, s_xx = x_terms
+    
+    # One matrix-vector product covers every series at once
+    y_mean = prices.mean(axis=1, dtype=np.float64)
+    y_centered = prices - y_mean[:, None]
+    s_xy = y_centered @ x_centered
+    s_yy = (y_centered * y_centered).sum(axis=1)
+    
+    slopes = s_xy / s_xx
+    intercepts = y_mean - slopes * x_mean
+    # R² is undefined for a flat series; report NaN as linregress does, without the warning
+    r_squared = np.divide(s_xy * s_xy, s_xx * s_yy, out=np.full_like(s_yy, np.nan), where=s_yy > 0)
+    
+    future_prices = slopes[:, None] * future_x + intercepts[:, None]
+    return slopes, intercepts, r_squared, future_prices
+
+
+def compute():
+    """Build the 2024 price table and fit a trend line per fuel"""
+    # One (12, 3) block backs every fuel column
+    prices_by_month = np.column_stack([petrol_prices, diesel_prices, lpg_prices])
+    df = pd.DataFrame(prices_by_month, index=pd.Index(months, name='Month'), columns=fuel_types)
+    
+    slopes, intercepts, r_squared, future_matrix = fit_all(month_axis, prices_by_month.T, future_months)
+    
+    predictions = {}
+    for i, fuel in enumerate(fuel_types):
+        slope = slopes[i]
+        predictions[fuel] = {
+            'slope': slope,
+            'intercept': intercepts[i],
+            'r_squared': r_squared[i],
+            'current_price': prices_by_month[-1, i],
+            'predicted_prices': future_matrix[i],
+            'trend': 'UPWARD' if slope > 0.01 else ('DOWNWARD' if slope < -0.01 else 'STABLE')
+        }
+    
+    return df, predictions
+
+
+def print_analysis(df, predictions):
+    """Print the price table, per-fuel statistics and trend predictions"""
+    print("=" * 70)
+    print("SOUTH AFRICAN FUEL PRICE ANALYSIS (January - December 2024)")
+    print("=" * 70)
+    print("\nMonthly Fuel Prices (ZAR per liter):")
+    print(df.reset_index().to_string(index=False, float_format='{:.2f}'.format))
+    print()
+    
+    # Calculate statistics
+    print("\n" + "=" * 70)
+    print("PRICE STATISTICS")
+    print("=" * 70)
+    
+    prices_mat = df[fuel_types].to_numpy(copy=False)
+    # One reduction per statistic covers every fuel; min/max are read back through argmin/argmax
+    averages = prices_mat.mean(axis=0)
+    lowest = prices_mat.argmin(axis=0)
+    highest = prices_mat.argmax(axis=0)
+    
+    for i, fuel in enumerate(fuel_types):
+        prices = prices_mat[:, i]
+        low, high = lowest[i], highest[i]
+        print(f"\n{fuel}:")
+        print(f"  Starting Price (January):  R{prices[0]:.2f}")
+        print(f"  Ending Price (December):   R{prices[-1]:.2f}")
+        print(f"  Change:                    R{prices[-1] - prices[0]:.2f} ({((prices[-1] - prices[0]) / prices[0] * 100):.2f}%)")
+        print(f"  Average Price:             R{averages[i]:.2f}")
+        print(f"  Minimum Price:             R{prices[low]:.2f} ({months[low]})")
+        print(f"  Maximum Price:             R{prices[high]:.2f} ({months[high]})")
+    
+    # Linear regression for trend analysis and prediction
+    print("\n" + "=" * 70)
+    print("TREND ANALYSIS & PREDICTIONS")
+    print("=" * 70)
+    
+    for fuel in fuel_types:
+        slope = predictions[fuel]['slope']
+        future_predictions = predictions[fuel]['predicted_prices']
+        
+        print(f"\n{fuel}:")
+        print(f"  Trend:                     {predictions[fuel]['trend']}")
+        print(f"  Monthly Change Rate:       R{slope:.4f} per month")
+        print(f"  Trend Strength (R²):       {predictions[fuel]['r_squared']:.4f}")
+        
+        if predictions[fuel]['trend'] != 'STABLE':
+            direction = "increase" if slope > 0 else "decrease"
+            print(f"  Analysis:                  Prices show a {direction} trend throughout 2024")
+        
+        print("\n  2025 Predictions:")
+        print(f"    January 2025:             R{future_predictions[0]:.2f}")
+        print(f"    February 2025:            R{future_predictions[1]:.2f}")
+        print(f"    March 2025:               R{future_predictions[2]:.2f}")
+
+
+def render(df, predictions, dpi=100):
+    """Plot historical prices and trend lines to sa_fuel_price_analysis.png"""
+    # Imported here so computing the statistics does not pay for matplotlib
+    import matplotlib.pyplot as plt
+    
+    prices_mat = df[fuel_types].to_numpy(copy=False)
+    
+    # Create visualization
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    
+    # Plot 1: Historical prices
+    ax1 = axes[0]
+    for i, fuel in enumerate(fuel_types):
+        ax1.plot(months, prices_mat[:, i], marker='o', linewidth=2, label=fuel)
+    ax1.set_xlabel('Month', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Price (ZAR/liter)', fontsize=11, fontweight='bold')
+    ax1.set_title('2024 South African Fuel Prices', fontsize=12, fontweight='bold')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.tick_params(axis='x', rotation=45)
+    
+    # Plot 2: Trend lines with predictions
+    ax2 = axes[1]
+    extended_months = np.arange(1, 16)
+    future_month_labels = months + ['Jan 2025', 'Feb 2025', 'Mar 2025']
+    
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
+    for i, fuel in enumerate(fuel_types):
+        prices = prices_mat[:, i]
+        slope, intercept = predictions[fuel]['slope'], predictions[fuel]['intercept']
+        trend_line = slope * extended_months + intercept
+        
+        ax2.plot(months, prices, marker='o', linewidth=2, label=fuel, color=colors[i])
+        ax2.plot(future_month_labels[-3:], trend_line[-3:], 
+                 linestyle='--', linewidth=2, color=colors[i], alpha=0.7)
+    
+    ax2.set_xlabel('Month', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Price (ZAR/liter)', fontsize=11, fontweight='bold')
+    ax2.set_title('Trend Analysis with Q1 2025 Predictions', fontsize=12, fontweight='bold')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    ax2.tick_params(axis='x', rotation=45)
+    
+    # tight_layout already fits the labels; bbox_inches='tight' would force a second draw
+    plt.tight_layout()
+    plt.savefig('sa_fuel_price_analysis.png', dpi=dpi)
+    plt.close(fig)
+
+
+def main():
+    """Main execution"""
+    # Headless backend for the script run only; importers keep their own backend
+    import matplotlib
+    matplotlib.use('Agg')
+    
+    df, predictions = compute()
+    print_analysis(df, predictions)
+    
+    render(df, predictions)
+    print("\n" + "=" * 70)
+    print("Chart saved as 'sa_fuel_price_analysis.png'")
+    print("=" * 70)
+    
+    # Summary and recommendations
+    print("\n" + "=" * 70)
+    print("SUMMARY & OUTLOOK")
+    print("=" * 70)
+    print("\nBased on the 2024 data analysis:")
+    print("\n• Petrol (95 ULP):  DOWNWARD TREND")
+    print("  After peaking in August (R22.15), petrol prices showed decline in Q4.")
+    print("  Prediction: Prices expected to continue declining through early 2025.")
+    
+    print("\n• Diesel (0.05%):   DOWNWARD TREND")
+    print("  Similar pattern to petrol with peak in July (R22.05).")
+    print("  Prediction: Expected to decrease further in Q1 2025.")
+    
+    print("\n• LPG:              DOWNWARD TREND")
+    print("  Stable mid-year prices with decline at year-end (R12.70).")
+    print("  Prediction: Likely to maintain lower prices through early 2025.")
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()